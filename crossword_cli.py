@@ -4,13 +4,215 @@ Crossword Construction CLI Tool
 Helps with NYT-style crossword theme creation
 """
 
-import argparse
+import functools
+import os
 import sys
-from typing import List, Tuple
-import urllib.request
-import urllib.parse
-import urllib.error
-import json
+import threading
+import time
+from typing import List, Optional, Tuple
+
+
+_EQ = "=" * 60
+_DASH = "-" * 60
+
+# Datamuse query template; only the relation and the encoded phrase vary per call.
+# Only as many words as are shown get requested, so responses carry nothing to discard.
+_WORDPLAY_RESULTS = 10
+_DATAMUSE_HOST = "api.datamuse.com"
+_DATAMUSE_PATH = f"/words?{{rel}}={{query}}&max={_WORDPLAY_RESULTS}"
+
+# Characters urllib.parse.quote leaves unescaped on every supported Python version
+_URL_SAFE_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-/")
+
+# Datamuse responses are requested gzip-compressed through one shared urllib opener
+_DATAMUSE_HEADERS = {"Accept-Encoding": "gzip"}
+_opener = None
+_opener_lock = threading.Lock()
+
+# On-disk cache of Datamuse responses, keyed by a hash of the request path
+_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "crossword_cli", "datamuse")
+_CACHE_TTL = 7 * 24 * 60 * 60
+_cache_lock = threading.Lock()
+
+# Speculative Datamuse fetches started from argv, keyed by request path. They run on
+# daemon threads and never touch the cache, so ones the parsed arguments never ask for
+# cost nothing at exit.
+_prefetched = {}
+
+
+# The networking stack is only imported once a Datamuse lookup is actually made,
+# so theme analysis and --guidelines start without loading it.
+@functools.lru_cache(maxsize=None)
+def _get_executor():
+    """Return the shared worker pool for overlapping Datamuse requests"""
+    import concurrent.futures
+    return concurrent.futures.ThreadPoolExecutor(max_workers=8)
+
+
+def _get_opener():
+    """Return the urllib opener shared by all Datamuse requests, building it on first use"""
+    global _opener
+    # Worker and prefetch threads ask for it concurrently; the lock makes sure only one
+    # TLS context (and its CA bundle load) is ever built
+    with _opener_lock:
+        if _opener is None:
+            import ssl
+            import urllib.request
+            # build_opener keeps the default proxy (https_proxy) and redirect handling
+            _opener = urllib.request.build_opener(
+                urllib.request.HTTPSHandler(context=ssl.create_default_context())
+            )
+    return _opener
+
+
+def _fetch_datamuse(path: str):
+    """Fetch a Datamuse API path and decode its JSON body"""
+    import gzip
+    import json
+    import urllib.request
+    
+    request = urllib.request.Request(f"https://{_DATAMUSE_HOST}{path}", headers=_DATAMUSE_HEADERS)
+    with _get_opener().open(request, timeout=5) as response:
+        body = response.read()
+        if response.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+    return json.loads(body)
+
+
+def _cache_key(path: str) -> str:
+    """Return the on-disk cache key for a Datamuse request path"""
+    import hashlib
+    return hashlib.sha1(path.encode()).hexdigest()
+
+
+def _read_cache(path: str):
+    """Return the cached response for a Datamuse path, or None if there is no fresh entry"""
+    import shelve
+    
+    # A missing, unreadable or corrupt cache (e.g. a truncated pickle) is just a miss;
+    # the live response fetched instead then overwrites the bad entry
+    try:
+        with _cache_lock, shelve.open(_CACHE_PATH, flag="r") as cache:
+            stored_at, data = cache[_cache_key(path)]
+        if time.time() - stored_at < _CACHE_TTL:
+            return data
+    except Exception:
+        pass
+    return None
+
+
+def _write_cache(path: str, data):
+    """Store a Datamuse response on disk and drop entries that have expired"""
+    import shelve
+    
+    # A cache that cannot be written is not an error; the next run simply fetches again
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        with _cache_lock, shelve.open(_CACHE_PATH) as cache:
+            now = time.time()
+            cache[_cache_key(path)] = (now, data)
+            for key in list(cache.keys()):
+                try:
+                    expired = now - cache[key][0] >= _CACHE_TTL
+                except Exception:
+                    expired = True
+                if expired:
+                    del cache[key]
+    except Exception:
+        pass
+
+
+def _cached_fetch_datamuse(path: str, use_cache: bool = True):
+    """Fetch a Datamuse API path, serving recent responses from the on-disk cache"""
+    if use_cache:
+        data = _read_cache(path)
+        if data is not None:
+            return data
+    
+    prefetched = _prefetched.pop(path, None)
+    data = prefetched.result() if prefetched is not None else _fetch_datamuse(path)
+    if use_cache:
+        _write_cache(path, data)
+    return data
+
+
+@functools.lru_cache(maxsize=256)
+def _quote(text: str) -> str:
+    """URL-encode text, skipping the encoder when nothing needs escaping"""
+    if _URL_SAFE_CHARS.issuperset(text):
+        return text
+    import urllib.parse
+    return urllib.parse.quote(text)
+
+
+def _datamuse_words(data: list, limit: int = _WORDPLAY_RESULTS) -> List[str]:
+    """Extract the non-empty words from the first entries of a Datamuse response"""
+    words = []
+    for item in data[:limit]:
+        word = item.get("word")
+        if word:
+            words.append(word)
+    return words
+
+
+def _wordplay_paths(base_phrase: str) -> dict:
+    """Map each suggest_wordplay result key to its Datamuse request path"""
+    # Clean the phrase and prepare for API call
+    clean_phrase = base_phrase.strip().lower()
+    if not clean_phrase:
+        # A blank phrase has no synonyms; skip the network entirely
+        return {}
+    encoded_phrase = _quote(clean_phrase)
+    
+    # Synonyms use ml (means like); related words (triggers, rhymes, etc.) use rel_trg
+    return {
+        key: _DATAMUSE_PATH.format(rel=rel, query=encoded_phrase)
+        for key, rel in (("synonyms", "ml"), ("related", "rel_trg"))
+    }
+
+
+def _fetch_in_background(path: str):
+    """Fetch a Datamuse path on a daemon thread, returning a future for the response"""
+    import concurrent.futures
+    
+    future = concurrent.futures.Future()
+    
+    def run():
+        try:
+            future.set_result(_fetch_datamuse(path))
+        except Exception as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _prefetch_wordplay(argv: List[str]):
+    """Start the --wordplay Datamuse requests found in argv before arguments are parsed"""
+    for i, arg in enumerate(argv):
+        if arg == "--":
+            return
+        # argparse also accepts unambiguous prefixes such as --word
+        name, has_value, value = arg.partition("=")
+        if len(name) < 3 or not "--wordplay".startswith(name):
+            continue
+        
+        if has_value:
+            phrase = value
+        elif i + 1 < len(argv):
+            phrase = argv[i + 1]
+        else:
+            return
+        # Another option rather than a phrase; argparse will reject or reinterpret it
+        if phrase.startswith("-"):
+            return
+        
+        # Whether the cache may be used is only known after parsing, so paths that are
+        # already cached are left for suggest_wordplay to read
+        for path in _wordplay_paths(phrase).values():
+            if _read_cache(path) is None:
+                _prefetched[path] = _fetch_in_background(path)
+        return
 
 
 class ThemeHelper:
@@ -22,18 +224,29 @@ class ThemeHelper:
     MIN_ENTRY_LENGTH = 8
     MAX_ENTRY_LENGTH = 15
     
+    # Message templates, pre-formatted with the guideline constants above
+    _TOO_SHORT_TMPL = f"Entry too short ({{length}} letters). NYT theme entries are typically {MIN_ENTRY_LENGTH}-{MAX_ENTRY_LENGTH} letters."
+    _TOO_LONG_TMPL = f"Entry too long ({{length}} letters). NYT theme entries are typically {MIN_ENTRY_LENGTH}-{MAX_ENTRY_LENGTH} letters."
+    _OK_TMPL = "✓ Good length ({length} letters)"
+    _COUNT_LOW_MSG = f"Consider adding more theme entries. NYT puzzles typically have {MIN_THEME_ENTRIES}-{MAX_THEME_ENTRIES} theme entries."
+    _COUNT_HIGH_TMPL = f"You have many theme entries ({{count}}). NYT puzzles typically have {MIN_THEME_ENTRIES}-{MAX_THEME_ENTRIES} theme entries."
+    _UNPAIRED_TMPL = "⚠️  Theme entries must be in pairs of equal lengths for symmetry. Unpaired lengths: {lengths}"
+    
     @staticmethod
-    def validate_entry_length(entry: str) -> Tuple[bool, str]:
+    def validate_entry_length(entry: str, length: Optional[int] = None) -> Tuple[bool, str]:
         """Validate if a theme entry has appropriate length"""
-        length = len(entry.replace(" ", ""))
+        if length is None:
+            length = len(entry) - entry.count(" ")
         
-        if length < ThemeHelper.MIN_ENTRY_LENGTH:
-            return False, f"Entry too short ({length} letters). NYT theme entries are typically {ThemeHelper.MIN_ENTRY_LENGTH}-{ThemeHelper.MAX_ENTRY_LENGTH} letters."
+        # Every valid length has a prebuilt result; only out-of-range lengths format a message
+        valid_result = _VALID_LENGTH_RESULTS.get(length)
+        if valid_result is not None:
+            return valid_result
         
-        if length > ThemeHelper.MAX_ENTRY_LENGTH:
-            return False, f"Entry too long ({length} letters). NYT theme entries are typically {ThemeHelper.MIN_ENTRY_LENGTH}-{ThemeHelper.MAX_ENTRY_LENGTH} letters."
+        if length < ThemeHelper.MIN_ENTRY_LENGTH:
+            return False, ThemeHelper._TOO_SHORT_TMPL.format(length=length)
         
-        return True, f"✓ Good length ({length} letters)"
+        return False, ThemeHelper._TOO_LONG_TMPL.format(length=length)
     
     @staticmethod
     def analyze_theme(entries: List[str]) -> dict:
@@ -47,42 +260,42 @@ class ThemeHelper:
         }
         
         # Process each entry
+        validate = ThemeHelper.validate_entry_length
+        append_entry = results["entries"].append
+        length_counts = {}
+        total_length = 0
         for entry in entries:
-            clean_entry = entry.replace(" ", "").upper()
-            length = len(clean_entry)
-            is_valid, message = ThemeHelper.validate_entry_length(entry)
+            length = len(entry) - entry.count(" ")
+            is_valid, message = validate(entry, length=length)
             
-            results["entries"].append({
+            append_entry({
                 "text": entry,
                 "length": length,
                 "valid": is_valid,
                 "message": message
             })
-            results["total_length"] += length
+            length_counts[length] = length_counts.get(length, 0) + 1
+            total_length += length
+        results["total_length"] = total_length
         
         # Check entry count
         if results["entry_count"] < ThemeHelper.MIN_THEME_ENTRIES:
-            results["warnings"].append(
-                f"Consider adding more theme entries. NYT puzzles typically have {ThemeHelper.MIN_THEME_ENTRIES}-{ThemeHelper.MAX_THEME_ENTRIES} theme entries."
-            )
+            results["warnings"].append(ThemeHelper._COUNT_LOW_MSG)
         elif results["entry_count"] > ThemeHelper.MAX_THEME_ENTRIES:
             results["warnings"].append(
-                f"You have many theme entries ({results['entry_count']}). NYT puzzles typically have {ThemeHelper.MIN_THEME_ENTRIES}-{ThemeHelper.MAX_THEME_ENTRIES} theme entries."
+                ThemeHelper._COUNT_HIGH_TMPL.format(count=results["entry_count"])
             )
         
         # Check for paired length symmetry
-        lengths = [e["length"] for e in results["entries"]]
-        if len(set(lengths)) == 1:
+        if len(length_counts) == 1:
             results["suggestions"].append("✓ All theme entries have the same length - excellent for symmetry!")
         else:
             # Check if entries can be paired by length
-            from collections import Counter
-            length_counts = Counter(lengths)
-            unpaired_lengths = [length for length, count in length_counts.items() if count % 2 != 0]
+            unpaired_lengths = [length for length, count in length_counts.items() if count & 1]
             
             if unpaired_lengths:
                 results["warnings"].append(
-                    f"⚠️  Theme entries must be in pairs of equal lengths for symmetry. Unpaired lengths: {sorted(unpaired_lengths)}"
+                    ThemeHelper._UNPAIRED_TMPL.format(lengths=sorted(unpaired_lengths))
                 )
             else:
                 results["suggestions"].append(
@@ -92,73 +305,131 @@ class ThemeHelper:
         return results
     
     @staticmethod
-    def suggest_wordplay(base_phrase: str) -> dict:
+    def suggest_wordplay(base_phrase: str, use_cache: bool = True) -> dict:
         """Get synonyms and related words for a phrase using Datamuse API"""
+        import urllib.error
+        
         results = {
             "synonyms": [],
             "related": [],
             "error": None
         }
         
-        try:
-            # Clean the phrase and prepare for API call
-            clean_phrase = base_phrase.strip().lower()
-            
-            # Get synonyms using Datamuse API (ml = means like)
-            encoded_phrase = urllib.parse.quote(clean_phrase)
-            synonym_url = f"https://api.datamuse.com/words?ml={encoded_phrase}&max=15"
-            
-            with urllib.request.urlopen(synonym_url, timeout=5) as response:
-                synonym_data = json.loads(response.read().decode())
-                results["synonyms"] = [item.get("word", "") for item in synonym_data[:10] if item.get("word")]
-            
-            # Get related words (triggers, rhymes, etc.) using rel_trg parameter
-            related_url = f"https://api.datamuse.com/words?rel_trg={encoded_phrase}&max=15"
-            
-            with urllib.request.urlopen(related_url, timeout=5) as response:
-                related_data = json.loads(response.read().decode())
-                results["related"] = [item.get("word", "") for item in related_data[:10] if item.get("word")]
-            
-        except urllib.error.URLError as e:
-            results["error"] = f"Network error: Unable to fetch synonyms. {str(e)}"
-        except Exception as e:
-            results["error"] = f"Error fetching synonyms: {str(e)}"
+        # Both requests are issued concurrently so their latencies overlap,
+        # reusing any fetch main() already started speculatively
+        futures = {
+            key: _get_executor().submit(_cached_fetch_datamuse, path, use_cache)
+            for key, path in _wordplay_paths(base_phrase).items()
+        }
+        
+        for key, future in futures.items():
+            try:
+                data = future.result()
+                results[key] = _datamuse_words(data)
+            except urllib.error.URLError as e:
+                if results["error"] is None:
+                    results["error"] = f"Network error: Unable to fetch synonyms. {str(e)}"
+            except Exception as e:
+                if results["error"] is None:
+                    results["error"] = f"Error fetching synonyms: {str(e)}"
         
         return results
 
 
+# validate_entry_length results for every in-range length, built once at import
+_VALID_LENGTH_RESULTS = {
+    length: (True, ThemeHelper._OK_TMPL.format(length=length))
+    for length in range(ThemeHelper.MIN_ENTRY_LENGTH, ThemeHelper.MAX_ENTRY_LENGTH + 1)
+}
+
+
+_GUIDELINES_TEXT = "\n".join((
+    "",
+    _EQ,
+    "NYT CROSSWORD CONSTRUCTION GUIDELINES",
+    _EQ,
+    "",
+    "For 15x15 Daily Puzzles:",
+    f"  • Theme entries: {ThemeHelper.MIN_THEME_ENTRIES}-{ThemeHelper.MAX_THEME_ENTRIES} entries",
+    f"  • Entry length: {ThemeHelper.MIN_ENTRY_LENGTH}-{ThemeHelper.MAX_ENTRY_LENGTH} letters each",
+    "  • All entries should follow the same theme logic",
+    "  • Entries should be symmetrically placed",
+    "  • Prefer equal-length entries for symmetry",
+    "  • Minimum 3 letters per word",
+    "  • Maximum 78 words for themed puzzles",
+    "  • All white squares must be 'checked' (crossed)",
+    "",
+    "For 21x21 Sunday Puzzles:",
+    "  • Larger grid allows for more theme entries",
+    "  • Similar proportional guidelines apply",
+    _EQ,
+    "",
+)) + "\n"
+
+
 def print_analysis(results: dict):
     """Pretty print the theme analysis results"""
-    print("\n" + "="*60)
-    print("THEME ANALYSIS")
-    print("="*60)
-    
-    print(f"\nTheme Entry Count: {results['entry_count']}")
-    print(f"Total Theme Length: {results['total_length']} letters")
-    
-    print("\nIndividual Entries:")
-    print("-" * 60)
-    for i, entry in enumerate(results["entries"], 1):
-        print(f"{i}. {entry['text']}")
-        print(f"   {entry['message']}")
+    out = [
+        "",
+        _EQ,
+        "THEME ANALYSIS",
+        _EQ,
+        "",
+        f"Theme Entry Count: {results['entry_count']}",
+        f"Total Theme Length: {results['total_length']} letters",
+        "",
+        "Individual Entries:",
+        _DASH,
+    ]
+    out.extend(
+        f"{i}. {entry['text']}\n   {entry['message']}"
+        for i, entry in enumerate(results["entries"], 1)
+    )
     
     if results["warnings"]:
-        print("\n⚠️  WARNINGS:")
-        print("-" * 60)
+        out.extend(("", "⚠️  WARNINGS:", _DASH))
         for warning in results["warnings"]:
-            print(f"  • {warning}")
+            out.append(f"  • {warning}")
     
     if results["suggestions"]:
-        print("\n💡 SUGGESTIONS:")
-        print("-" * 60)
+        out.extend(("", "💡 SUGGESTIONS:", _DASH))
         for suggestion in results["suggestions"]:
-            print(f"  • {suggestion}")
+            out.append(f"  • {suggestion}")
     
-    print("\n" + "="*60)
+    out.extend(("", _EQ))
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def main():
-    """Main CLI entry point"""
+def print_wordplay(phrase: str, results: dict):
+    """Pretty print the synonyms and related words for a phrase"""
+    out = ["", f"Synonyms and related words for: {phrase}", _EQ]
+    
+    if results["error"]:
+        out.extend(("", f"⚠️  {results['error']}", "", "Please check your internet connection and try again."))
+    else:
+        if results["synonyms"]:
+            out.extend(("", "📚 SYNONYMS (similar meanings):", _DASH))
+            for i, word in enumerate(results["synonyms"], 1):
+                out.append(f"  {i:2d}. {word}")
+        else:
+            out.extend(("", "📚 SYNONYMS: No synonyms found."))
+        
+        if results["related"]:
+            out.extend(("", "🔗 RELATED WORDS (associated concepts):", _DASH))
+            for i, word in enumerate(results["related"], 1):
+                out.append(f"  {i:2d}. {word}")
+        else:
+            out.extend(("", "🔗 RELATED WORDS: No related words found."))
+    
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser():
+    """Build the command-line argument parser"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Crossword Construction CLI - Aid in NYT-style crossword theme creation",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -185,65 +456,39 @@ Examples:
         help="Get synonyms and related words for a phrase"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the local cache and always query Datamuse for --wordplay"
+    )
+    
     parser.add_argument(
         "--guidelines",
         action="store_true",
         help="Display NYT crossword construction guidelines"
     )
     
+    return parser
+
+
+def main():
+    """Main CLI entry point"""
+    # Overlap the Datamuse round trips with argument parsing and dispatch
+    _prefetch_wordplay(sys.argv[1:])
+    parser = _build_parser()
     args = parser.parse_args()
     
     # Handle commands
     if args.guidelines:
-        print("\n" + "="*60)
-        print("NYT CROSSWORD CONSTRUCTION GUIDELINES")
-        print("="*60)
-        print("\nFor 15x15 Daily Puzzles:")
-        print(f"  • Theme entries: {ThemeHelper.MIN_THEME_ENTRIES}-{ThemeHelper.MAX_THEME_ENTRIES} entries")
-        print(f"  • Entry length: {ThemeHelper.MIN_ENTRY_LENGTH}-{ThemeHelper.MAX_ENTRY_LENGTH} letters each")
-        print("  • All entries should follow the same theme logic")
-        print("  • Entries should be symmetrically placed")
-        print("  • Prefer equal-length entries for symmetry")
-        print("  • Minimum 3 letters per word")
-        print("  • Maximum 78 words for themed puzzles")
-        print("  • All white squares must be 'checked' (crossed)")
-        print("\nFor 21x21 Sunday Puzzles:")
-        print("  • Larger grid allows for more theme entries")
-        print("  • Similar proportional guidelines apply")
-        print("="*60 + "\n")
+        sys.stdout.write(_GUIDELINES_TEXT)
     
     elif args.analyze:
         results = ThemeHelper.analyze_theme(args.analyze)
         print_analysis(results)
     
     elif args.wordplay:
-        results = ThemeHelper.suggest_wordplay(args.wordplay)
-        
-        print(f"\nSynonyms and related words for: {args.wordplay}")
-        print("=" * 60)
-        
-        if results["error"]:
-            print(f"\n⚠️  {results['error']}")
-            print("\nPlease check your internet connection and try again.")
-        else:
-            if results["synonyms"]:
-                print("\n📚 SYNONYMS (similar meanings):")
-                print("-" * 60)
-                for i, word in enumerate(results["synonyms"], 1):
-                    print(f"  {i:2d}. {word}")
-            else:
-                print("\n📚 SYNONYMS: No synonyms found.")
-            
-            if results["related"]:
-                print("\n🔗 RELATED WORDS (associated concepts):")
-                print("-" * 60)
-                for i, word in enumerate(results["related"], 1):
-                    print(f"  {i:2d}. {word}")
-            else:
-                print("\n🔗 RELATED WORDS: No related words found.")
-        
-        print()
-
+        results = ThemeHelper.suggest_wordplay(args.wordplay, use_cache=not args.no_cache)
+        print_wordplay(args.wordplay, results)
     
     else:
         parser.print_help()